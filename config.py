@@ -7,8 +7,12 @@ import os
 from pathlib import Path
 from dotenv import load_dotenv
 
+# Set once config has been loaded and validated; child processes inherit it
+LOADED_FLAG = '_TEXTAI_CFG_LOADED'
+
 # Load environment variables
-load_dotenv()
+if not os.environ.get(LOADED_FLAG):
+    load_dotenv()
 
 class Config:
     """Application configuration."""
@@ -45,6 +49,8 @@ class Config:
     ENABLE_MODEL_CACHE = os.getenv('ENABLE_MODEL_CACHE', 'true').lower() == 'true'
     CACHE_TTL = int(os.getenv('CACHE_TTL', '300'))
     MAX_BATCH_SIZE = int(os.getenv('MAX_BATCH_SIZE', '100'))
+    ENABLE_INT8 = os.getenv('ENABLE_INT8', 'false').lower() == 'true'
+    ENABLE_ONNX = os.getenv('ENABLE_ONNX', 'false').lower() == 'true'
 
     # Rate Limiting
     GUEST_RATE_LIMIT = int(os.getenv('GUEST_RATE_LIMIT', '10'))
@@ -88,5 +94,8 @@ class Config:
         cls.MODEL_CACHE_DIR.mkdir(exist_ok=True)
         cls.LOG_FILE.parent.mkdir(exist_ok=True)
 
-# Validate on import
-Config.validate()
+# Validate and create directories on first import only
+if not os.environ.get(LOADED_FLAG):
+    Config.validate()
+    Config.create_directories()
+    os.environ[LOADED_FLAG] = '1'
@@ -10,23 +10,48 @@ Complete NLP platform with 4 AI-powered tools:
 - Job Matching
 """
 
+import os
+from config import Config
+
+# Keep downloaded models in MODEL_CACHE_DIR; must run before transformers is imported
+os.environ.setdefault('HF_HOME', str(Config.MODEL_CACHE_DIR.resolve()))
+
 import streamlit as st
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
+import numpy as np
 from transformers import pipeline, AutoTokenizer, AutoModel
 import torch
 from sentence_transformers import SentenceTransformer, util
 import json
-import os
 import hashlib
+import hmac
+import sqlite3
+import threading
 import secrets
 import time
-from datetime import datetime, timedelta
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
 from pathlib import Path
 import bcrypt
 import base64
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+
+try:
+    import onnxruntime
+    from optimum.onnxruntime import ORTModelForSequenceClassification, ORTQuantizer
+    from optimum.onnxruntime.configuration import AutoQuantizationConfig
+except ImportError:
+    ORTModelForSequenceClassification = None
+
+# Inference only: never record autograd state
+torch.set_grad_enabled(False)
+
 # Page configuration
 st.set_page_config(
     page_title="TextAI Studio",
@@ -37,15 +62,15 @@ st.set_page_config(
 
 # Configuration
 USER_DATA_DIR = Path("user_data")
+DB_FILE = USER_DATA_DIR / "app.db"
+
+# Legacy JSON storage (imported into the database on first start)
 HISTORY_DIR = USER_DATA_DIR / "history"
 API_KEYS_DIR = USER_DATA_DIR / "api_keys"
 USERS_FILE = USER_DATA_DIR / "users.json"
-RATE_LIMITS_FILE = USER_DATA_DIR / "rate_limits.json"
 
 # Create directories
 USER_DATA_DIR.mkdir(exist_ok=True)
-HISTORY_DIR.mkdir(exist_ok=True)
-API_KEYS_DIR.mkdir(exist_ok=True)
 
 # Rate limiting configuration
 RATE_LIMITS = {
@@ -54,6 +79,141 @@ RATE_LIMITS = {
     'pro': 1000       # 1000 requests per hour
 }
 
+# Sidebar navigation
+AUTH_NAV_OPTIONS = (
+    "🏠 Home",
+    "😊 Sentiment Analysis",
+    "📄 Text Summarization",
+    "🔍 Fake News Detection",
+    "💼 Job Matching",
+    "📁 Batch Processing",
+    "📊 Analytics",
+    "⚙️ Settings"
+)
+ANON_NAV_OPTIONS = ("🏠 Home", "🔐 Login", "📝 Signup")
+
+# Number of history entries kept per user
+HISTORY_LIMIT = 100
+
+# Trim a user's history once every this many inserts
+HISTORY_COMPACT_EVERY = 20
+
+# User fields that can be stored and updated
+USER_FIELDS = ('password', 'email', 'tier', 'created_at', 'api_key')
+
+# ==================================================
+# DATABASE
+# ==================================================
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS users (
+    username TEXT PRIMARY KEY,
+    password TEXT NOT NULL,
+    email TEXT,
+    tier TEXT NOT NULL DEFAULT 'user',
+    created_at TEXT,
+    api_key TEXT
+);
+CREATE TABLE IF NOT EXISTS history (
+    username TEXT NOT NULL,
+    ts REAL NOT NULL,
+    tool TEXT,
+    query TEXT,
+    result TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_history_user_ts ON history (username, ts);
+CREATE TABLE IF NOT EXISTS rate_limits (
+    username TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_rate_limits_user_ts ON rate_limits (username, ts);
+CREATE TABLE IF NOT EXISTS api_keys (
+    key_hash TEXT PRIMARY KEY,
+    username TEXT NOT NULL,
+    created_at TEXT
+);
+"""
+
+
+class Database:
+    """Shared SQLite connection in WAL mode."""
+    
+    def __init__(self, db_file):
+        self.conn = sqlite3.connect(db_file, check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        self.lock = threading.Lock()
+        
+        # WAL lets readers proceed while a write is in progress
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(SCHEMA)
+        self._import_legacy_json()
+    
+    def execute(self, sql, params=()):
+        """Run a single statement and return all rows."""
+        with self.lock, self.conn:
+            return self.conn.execute(sql, params).fetchall()
+    
+    @contextmanager
+    def transaction(self):
+        """Run several statements atomically."""
+        with self.lock, self.conn:
+            yield self.conn
+    
+    def _import_legacy_json(self):
+        """Import users, API keys and history from the old JSON files."""
+        if not USERS_FILE.exists():
+            return
+        if self.conn.execute("SELECT 1 FROM users LIMIT 1").fetchone():
+            return
+        
+        with open(USERS_FILE, 'r') as f:
+            users = json.load(f)
+        
+        keys_file = API_KEYS_DIR / "api_keys.json"
+        keys = {}
+        if keys_file.exists():
+            with open(keys_file, 'r') as f:
+                keys = json.load(f)
+        
+        history = []
+        for history_file in HISTORY_DIR.glob("*.json"):
+            with open(history_file, 'r') as f:
+                for entry in json.load(f):
+                    history.append((
+                        history_file.stem,
+                        datetime.fromisoformat(entry['timestamp']).timestamp(),
+                        entry['tool'],
+                        entry['query'],
+                        entry['result']
+                    ))
+        
+        with self.conn:
+            self.conn.executemany(
+                "INSERT INTO users (username, password, email, tier, created_at, api_key) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (username, data['password'], data.get('email'), data.get('tier', 'user'),
+                     data.get('created_at'), data.get('api_key'))
+                    for username, data in users.items()
+                ]
+            )
+            self.conn.executemany(
+                "INSERT OR IGNORE INTO api_keys (key_hash, username, created_at) VALUES (?, ?, ?)",
+                [(key_hash, data['username'], data.get('created_at')) for key_hash, data in keys.items()]
+            )
+            self.conn.executemany(
+                "INSERT INTO history (username, ts, tool, query, result) VALUES (?, ?, ?, ?, ?)",
+                history
+            )
+
+
+@st.cache_resource
+def get_database():
+    """Open the application database once per process."""
+    return Database(DB_FILE)
+
+
 # ==================================================
 # HELPER CLASSES
 # ==================================================
@@ -62,45 +222,57 @@ class UserManager:
     """Manage user authentication and profiles."""
     
     def __init__(self):
-        self.users_file = USERS_FILE
-        self.users = self._load_users()
-    
-    def _load_users(self):
-        """Load users from file."""
-        if self.users_file.exists():
-            with open(self.users_file, 'r') as f:
-                return json.load(f)
-        return {}
-    
-    def _save_users(self):
-        """Save users to file."""
-        with open(self.users_file, 'w') as f:
-            json.dump(self.users, f, indent=2)
+        self.db = get_database()
+        self._users = None
+        self._data_version = None
+        # Guards the cache so a reload cannot overwrite a concurrent invalidation
+        self._lock = threading.Lock()
+    
+    @property
+    def users(self):
+        """All users keyed by username, reloaded only when the database changed."""
+        # data_version only moves on commits from other connections,
+        # so our own writes reset the cache explicitly
+        with self._lock:
+            data_version = self.db.execute("PRAGMA data_version")[0][0]
+            if self._users is None or data_version != self._data_version:
+                rows = self.db.execute("SELECT * FROM users")
+                self._users = {row['username']: dict(row) for row in rows}
+                self._data_version = data_version
+            return self._users
+    
+    def _invalidate(self):
+        """Drop the cached users after a write on this connection."""
+        with self._lock:
+            self._users = None
     
     def register_user(self, username, password, email):
         """Register a new user."""
-        if username in self.users:
+        if self.get_user(username) is not None:
             return False, "Username already exists"
         
         # Hash password
         hashed = bcrypt.hashpw(password.encode('utf-8'), bcrypt.gensalt())
         
-        self.users[username] = {
-            'password': hashed.decode('utf-8'),
-            'email': email,
-            'tier': 'user',
-            'created_at': datetime.now().isoformat(),
-            'api_key': None
-        }
-        self._save_users()
+        try:
+            self.db.execute(
+                "INSERT INTO users (username, password, email, tier, created_at, api_key) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (username, hashed.decode('utf-8'), email, 'user', datetime.now().isoformat(), None)
+            )
+        except sqlite3.IntegrityError:
+            # Lost a race with a concurrent signup for the same name
+            return False, "Username already exists"
+        self._invalidate()
         return True, "Registration successful"
     
     def authenticate_user(self, username, password):
         """Authenticate user."""
-        if username not in self.users:
+        user = self.get_user(username)
+        if user is None:
             return False
         
-        stored_hash = self.users[username]['password'].encode('utf-8')
+        stored_hash = user['password'].encode('utf-8')
         return bcrypt.checkpw(password.encode('utf-8'), stored_hash)
     
     def get_user(self, username):
@@ -109,97 +281,125 @@ class UserManager:
     
     def update_user(self, username, updates):
         """Update user data."""
-        if username in self.users:
-            self.users[username].update(updates)
-            self._save_users()
-            return True
-        return False
+        fields = [field for field in updates if field in USER_FIELDS]
+        if not fields:
+            return False
+        
+        assignments = ", ".join(f"{field} = ?" for field in fields)
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                f"UPDATE users SET {assignments} WHERE username = ?",
+                [updates[field] for field in fields] + [username]
+            )
+        self._invalidate()
+        return cursor.rowcount > 0
 
 
 class HistoryManager:
     """Manage user query history."""
     
     def __init__(self):
-        self.history_dir = HISTORY_DIR
+        self.db = get_database()
+        # Inserts per user since the last compaction
+        self._pending = Counter()
+        self._lock = threading.Lock()
     
     def add_entry(self, username, tool, query, result):
         """Add history entry."""
-        history_file = self.history_dir / f"{username}.json"
-        
-        # Load existing history
-        if history_file.exists():
-            with open(history_file, 'r') as f:
-                history = json.load(f)
-        else:
-            history = []
-        
-        # Add new entry
-        entry = {
-            'timestamp': datetime.now().isoformat(),
-            'tool': tool,
-            'query': query[:200],  # Truncate long queries
-            'result': str(result)[:500]  # Truncate long results
-        }
-        history.append(entry)
-        
-        # Keep last 100 entries
-        history = history[-100:]
+        self.db.execute(
+            "INSERT INTO history (username, ts, tool, query, result) VALUES (?, ?, ?, ?, ?)",
+            (
+                username,
+                time.time(),
+                tool,
+                query[:200],  # Truncate long queries
+                str(result)[:500]  # Truncate long results
+            )
+        )
         
-        # Save
-        with open(history_file, 'w') as f:
-            json.dump(history, f, indent=2)
+        with self._lock:
+            # The counter is in-memory only, so the first insert per user after
+            # a restart also compacts; otherwise light users would never be trimmed
+            compact = (username not in self._pending
+                       or self._pending[username] + 1 >= HISTORY_COMPACT_EVERY)
+            self._pending[username] = 0 if compact else self._pending[username] + 1
+        if compact:
+            self._compact(username)
+    
+    def _compact(self, username):
+        """Keep only the last HISTORY_LIMIT entries for a user."""
+        self.db.execute(
+            "DELETE FROM history WHERE username = ? AND ts < ("
+            "SELECT ts FROM history WHERE username = ? ORDER BY ts DESC LIMIT 1 OFFSET ?)",
+            (username, username, HISTORY_LIMIT - 1)
+        )
     
     def get_history(self, username, limit=50):
-        """Get user history."""
-        history_file = self.history_dir / f"{username}.json"
-        
-        if not history_file.exists():
-            return []
+        """Get user history, oldest first."""
+        rows = self.db.execute(
+            "SELECT ts, tool, query, result FROM history WHERE username = ? "
+            "ORDER BY ts DESC LIMIT ?",
+            (username, limit)
+        )
         
-        with open(history_file, 'r') as f:
-            history = json.load(f)
-        
-        return history[-limit:]
+        # Timestamps stay epoch floats; pages format them for display
+        return [dict(row) for row in reversed(rows)]
+    
+    def last_entry_ts(self, username):
+        """Timestamp of the user's newest entry, or None; changes whenever history grows."""
+        return self.db.execute(
+            "SELECT max(ts) FROM history WHERE username = ?", (username,)
+        )[0][0]
+    
+    def count_entries(self):
+        """Count history entries across all users."""
+        return self.db.execute("SELECT count(*) FROM history")[0][0]
     
     def get_analytics(self, username):
         """Get usage analytics."""
-        history = self.get_history(username, limit=1000)
+        history = self.get_history(username, limit=HISTORY_LIMIT)
         
         if not history:
             return None
         
-        df = pd.DataFrame(history)
-        df['timestamp'] = pd.to_datetime(df['timestamp'])
+        now = time.time()
+        week_ago = now - 7 * 86400
+        month_ago = now - 30 * 86400
+        
+        # Single pass; history is oldest first so dates come out in order
+        tools = Counter()
+        by_date = Counter()
+        last_7 = last_30 = 0
+        for entry in history:
+            ts = entry['ts']
+            tools[entry['tool']] += 1
+            by_date[datetime.fromtimestamp(ts).date()] += 1
+            last_7 += ts > week_ago
+            last_30 += ts > month_ago
         
         analytics = {
-            'total_queries': len(df),
-            'tools_used': df['tool'].value_counts().to_dict(),
-            'queries_by_date': df.groupby(df['timestamp'].dt.date).size().to_dict(),
-            'last_7_days': len(df[df['timestamp'] > datetime.now() - timedelta(days=7)]),
-            'last_30_days': len(df[df['timestamp'] > datetime.now() - timedelta(days=30)])
+            'total_queries': len(history),
+            'tools_used': dict(tools.most_common()),
+            'queries_by_date': dict(by_date),
+            'last_7_days': last_7,
+            'last_30_days': last_30
         }
         
         return analytics
 
 
+def hash_api_key(api_key):
+    """Hash an API key for storage."""
+    return hashlib.blake2b(api_key.encode(), digest_size=32).hexdigest()
+
+
 class APIKeyManager:
     """Manage API keys."""
     
     def __init__(self):
-        self.api_keys_file = API_KEYS_DIR / "api_keys.json"
-        self.keys = self._load_keys()
-    
-    def _load_keys(self):
-        """Load API keys."""
-        if self.api_keys_file.exists():
-            with open(self.api_keys_file, 'r') as f:
-                return json.load(f)
-        return {}
-    
-    def _save_keys(self):
-        """Save API keys."""
-        with open(self.api_keys_file, 'w') as f:
-            json.dump(self.keys, f, indent=2)
+        self.db = get_database()
+        # Raw key -> username for keys already validated; only hashes hit disk
+        self._raw_cache = {}
     
     def generate_key(self, username):
         """Generate API key for user."""
@@ -208,26 +408,42 @@ class APIKeyManager:
         api_key = 'sk_' + base64.b64encode(random_bytes).decode('utf-8')
         
         # Hash for storage
-        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
+        key_hash = hash_api_key(api_key)
         
-        self.keys[key_hash] = {
-            'username': username,
-            'created_at': datetime.now().isoformat()
-        }
-        self._save_keys()
+        self.db.execute(
+            "INSERT INTO api_keys (key_hash, username, created_at) VALUES (?, ?, ?)",
+            (key_hash, username, datetime.now().isoformat())
+        )
+        self._raw_cache[api_key] = username
         
         return api_key
     
     def validate_key(self, api_key):
         """Validate API key."""
-        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-        return key_hash in self.keys
+        return self.get_user_by_key(api_key) is not None
     
     def get_user_by_key(self, api_key):
         """Get username from API key."""
-        key_hash = hashlib.sha256(api_key.encode()).hexdigest()
-        if key_hash in self.keys:
-            return self.keys[key_hash]['username']
+        username = self._raw_cache.get(api_key)
+        if username is not None:
+            return username
+        
+        key_hash = hash_api_key(api_key)
+        rows = self.db.execute("SELECT username FROM api_keys WHERE key_hash = ?", (key_hash,))
+        if not rows:
+            # Keys created before BLAKE2b were stored as SHA-256; upgrade on first use
+            legacy_hash = hashlib.sha256(api_key.encode()).hexdigest()
+            rows = self.db.execute("SELECT username FROM api_keys WHERE key_hash = ?", (legacy_hash,))
+            if rows:
+                self.db.execute(
+                    "UPDATE api_keys SET key_hash = ? WHERE key_hash = ?",
+                    (key_hash, legacy_hash)
+                )
+        if rows:
+            # Only valid keys are cached so bogus keys cannot grow the cache
+            username = rows[0]['username']
+            self._raw_cache[api_key] = username
+            return username
         return None
 
 
@@ -235,70 +451,246 @@ class RateLimiter:
     """Rate limiting for API requests."""
     
     def __init__(self):
-        self.limits_file = RATE_LIMITS_FILE
-        self.limits = self._load_limits()
-    
-    def _load_limits(self):
-        """Load rate limits."""
-        if self.limits_file.exists():
-            with open(self.limits_file, 'r') as f:
-                return json.load(f)
-        return {}
-    
-    def _save_limits(self):
-        """Save rate limits."""
-        with open(self.limits_file, 'w') as f:
-            json.dump(self.limits, f, indent=2)
+        self.db = get_database()
+        self.lock = threading.Lock()
+        # Username -> deque of request times (epoch floats), oldest first
+        self.limits = {}
+    
+    def _load_window(self, username, hour_ago):
+        """Load a user's requests from the last hour."""
+        rows = self.db.execute(
+            "SELECT ts FROM rate_limits WHERE username = ? AND ts > ? ORDER BY ts",
+            (username, hour_ago)
+        )
+        return deque(row['ts'] for row in rows)
     
     def check_limit(self, username, tier='user'):
         """Check if user is within rate limit."""
-        now = datetime.now()
-        hour_ago = now - timedelta(hours=1)
-        
-        if username not in self.limits:
-            self.limits[username] = []
-        
-        # Remove old entries
-        self.limits[username] = [
-            ts for ts in self.limits[username]
-            if datetime.fromisoformat(ts) > hour_ago
-        ]
-        
-        # Check limit
+        now = time.time()
+        hour_ago = now - 3600
         limit = RATE_LIMITS.get(tier, 10)
-        if len(self.limits[username]) >= limit:
-            return False, f"Rate limit exceeded. Limit: {limit}/hour"
-        
-        # Add new request
-        self.limits[username].append(now.isoformat())
-        self._save_limits()
         
-        return True, f"Remaining: {limit - len(self.limits[username])}/{limit}"
+        with self.lock:
+            window = self.limits.get(username)
+            if window is None:
+                window = self.limits[username] = self._load_window(username, hour_ago)
+            
+            # Remove old entries
+            expired = False
+            popleft = window.popleft
+            while window and window[0] <= hour_ago:
+                popleft()
+                expired = True
+            if expired:
+                self.db.execute(
+                    "DELETE FROM rate_limits WHERE username = ? AND ts <= ?",
+                    (username, hour_ago)
+                )
+            
+            # Check limit
+            if len(window) >= limit:
+                return False, f"Rate limit exceeded. Limit: {limit}/hour"
+            
+            # Add new request
+            window.append(now)
+            self.db.execute("INSERT INTO rate_limits (username, ts) VALUES (?, ?)", (username, now))
+            
+            return True, f"Remaining: {limit - len(window)}/{limit}"
+
+
+@st.cache_resource
+def get_user_manager():
+    """Shared UserManager instance."""
+    return UserManager()
+
+@st.cache_resource
+def get_history_manager():
+    """Shared HistoryManager instance."""
+    return HistoryManager()
+
+@st.cache_resource
+def get_api_key_manager():
+    """Shared APIKeyManager instance."""
+    return APIKeyManager()
+
+@st.cache_resource
+def get_rate_limiter():
+    """Shared RateLimiter instance."""
+    return RateLimiter()
+
+@st.cache_data(max_entries=1000, show_spinner=False)
+def cached_analytics(username, last_ts, today):
+    """Usage analytics, recomputed when last_ts (the newest entry) or the day changes."""
+    return get_history_manager().get_analytics(username)
+
+@st.cache_data(max_entries=1000, show_spinner=False)
+def recent_activity_df(username, last_ts, limit=10):
+    """Recent history table, rebuilt only when last_ts (the newest entry) changes."""
+    history = get_history_manager().get_history(username, limit=limit)
+    if not history:
+        return None
+    
+    history_df = pd.DataFrame(history)
+    # Server-local time, matching the daily buckets in get_analytics
+    history_df['timestamp'] = pd.to_datetime([datetime.fromtimestamp(ts) for ts in history_df['ts']])
+    return history_df[['timestamp', 'tool', 'query']]
+
+@st.cache_data(ttl=60, show_spinner=False)
+def total_query_count():
+    """Count history entries across all users, at most once a minute."""
+    return get_history_manager().count_entries()
 
 
 # ==================================================
 # MODEL LOADING (CACHED)
 # ==================================================
 
+# Pipeline task and checkpoint per tool
+MODEL_SPECS = {
+    'sentiment': ('sentiment-analysis', 'distilbert-base-uncased-finetuned-sst-2-english'),
+    'summarization': ('summarization', 'facebook/bart-large-cnn'),
+    'fake_news': ('text-classification', 'hamzab/roberta-fake-news-classification'),
+}
+JOB_MATCHER_MODEL = 'sentence-transformers/all-MiniLM-L6-v2'
+
+# Job match thresholds (inclusive lower bounds) and labels, weakest first
+MATCH_THRESHOLDS = np.array([0.6, 0.7, 0.8, 0.9])
+MATCH_LABELS = np.array(["Weak Match", "Fair Match", "Good Match", "Strong Match", "Excellent Match"])
+
+# BART generation is memory-heavy, so summaries use smaller batches
+SUMMARY_BATCH_SIZE = 8
+
+# Tools served through ONNX Runtime when ENABLE_ONNX is set
+ONNX_MODELS = ('sentiment', 'fake_news')
+
+
+def quantize_int8(model):
+    """Swap a model's Linear layers for dynamic int8 versions (CPU only)."""
+    return torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class ModelRegistry:
+    """Build models lazily on first use and share tokenizers per checkpoint."""
+    
+    def __init__(self):
+        self._models = {}
+        self._tokenizers = {}
+        # One lock per model/checkpoint so a slow first load never blocks other tools
+        self._locks = {}
+        self._lock = threading.Lock()
+        
+        # First GPU when present (pipeline device 0), otherwise CPU (-1)
+        self.device = 0 if torch.cuda.is_available() else -1
+        
+        # Small-batch CPU inference: intra-op threads on half the cores, one inter-op thread
+        torch.set_num_threads(max(1, (os.cpu_count() or 1) // 2))
+        try:
+            torch.set_num_interop_threads(1)
+        except RuntimeError:
+            # Only allowed once per process, before any inter-op work has started
+            pass
+    
+    def _key_lock(self, key):
+        """Lock guarding the first load of one model or tokenizer."""
+        with self._lock:
+            return self._locks.setdefault(key, threading.Lock())
+    
+    def get(self, name):
+        """Get a model by tool name, building it on first access."""
+        model = self._models.get(name)
+        if model is None:
+            with self._key_lock(('model', name)):
+                if name not in self._models:
+                    self._models[name] = self._build(name)
+                model = self._models[name]
+        return model
+    
+    def _tokenizer(self, checkpoint):
+        """Load a fast tokenizer once per checkpoint."""
+        tokenizer = self._tokenizers.get(checkpoint)
+        if tokenizer is None:
+            with self._key_lock(('tokenizer', checkpoint)):
+                if checkpoint not in self._tokenizers:
+                    self._tokenizers[checkpoint] = AutoTokenizer.from_pretrained(checkpoint, use_fast=True)
+                tokenizer = self._tokenizers[checkpoint]
+        return tokenizer
+    
+    def _build(self, name):
+        """Instantiate a model."""
+        on_gpu = self.device >= 0
+        
+        if name == 'job_matcher':
+            model = SentenceTransformer(JOB_MATCHER_MODEL, device='cuda' if on_gpu else 'cpu')
+            model.eval()
+            if on_gpu:
+                model.half()
+            elif Config.ENABLE_INT8:
+                transformer = model._first_module()
+                transformer.auto_model = quantize_int8(transformer.auto_model)
+            return model
+        
+        task, checkpoint = MODEL_SPECS[name]
+        if (name in ONNX_MODELS and Config.ENABLE_ONNX and not on_gpu
+                and ORTModelForSequenceClassification is not None):
+            return pipeline(task, model=self._onnx_model(checkpoint), tokenizer=self._tokenizer(checkpoint))
+        
+        model = pipeline(
+            task,
+            model=checkpoint,
+            tokenizer=self._tokenizer(checkpoint),
+            device=self.device,
+            torch_dtype=torch.float16 if on_gpu else None
+        )
+        model.model.eval()
+        if Config.ENABLE_INT8 and not on_gpu:
+            model.model = quantize_int8(model.model)
+        return model
+    
+    def _onnx_model(self, checkpoint):
+        """Load a classifier as ONNX, exporting (and quantizing) it to the model cache on first use."""
+        export_dir = Config.MODEL_CACHE_DIR / "onnx" / checkpoint.replace('/', '--')
+        if not (export_dir / "model.onnx").exists():
+            model = ORTModelForSequenceClassification.from_pretrained(checkpoint, export=True)
+            model.save_pretrained(export_dir)
+        
+        file_name = "model.onnx"
+        if Config.ENABLE_INT8:
+            # Dynamic int8 weights; MatMuls use VNNI instructions where the CPU has them
+            file_name = "model_quantized.onnx"
+            if not (export_dir / file_name).exists():
+                quantizer = ORTQuantizer.from_pretrained(export_dir)
+                quantization_config = AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False)
+                quantizer.quantize(save_dir=export_dir, quantization_config=quantization_config)
+        
+        sess_options = onnxruntime.SessionOptions()
+        sess_options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        sess_options.intra_op_num_threads = os.cpu_count() or 1
+        
+        return ORTModelForSequenceClassification.from_pretrained(
+            export_dir, file_name=file_name, session_options=sess_options
+        )
+
+
 @st.cache_resource
+def get_model_registry():
+    """Shared ModelRegistry instance."""
+    return ModelRegistry()
+
 def load_sentiment_model():
     """Load sentiment analysis model."""
-    return pipeline('sentiment-analysis', model='distilbert-base-uncased-finetuned-sst-2-english')
+    return get_model_registry().get('sentiment')
 
-@st.cache_resource
 def load_summarization_model():
     """Load summarization model."""
-    return pipeline('summarization', model='facebook/bart-large-cnn')
+    return get_model_registry().get('summarization')
 
-@st.cache_resource
 def load_fake_news_model():
     """Load fake news detection model."""
-    return pipeline('text-classification', model='hamzab/roberta-fake-news-classification')
+    return get_model_registry().get('fake_news')
 
-@st.cache_resource
 def load_job_matcher_model():
     """Load job matching model."""
-    return SentenceTransformer('sentence-transformers/all-MiniLM-L6-v2')
+    return get_model_registry().get('job_matcher')
 
 
 # ==================================================
@@ -307,29 +699,69 @@ def load_job_matcher_model():
 
 def analyze_sentiment(text):
     """Analyze sentiment of text."""
+    return analyze_sentiment_batch([text])[0]
+
+def analyze_sentiment_batch(texts):
+    """Analyze sentiment of a list of texts in batched forward passes."""
     model = load_sentiment_model()
-    result = model(text[:512])[0]  # Truncate to 512 tokens
-    return result
+    with torch.inference_mode():
+        # The tokenizer truncates to 512 tokens, not characters
+        return model(
+            list(texts),
+            batch_size=Config.MAX_BATCH_SIZE,
+            truncation=True,
+            max_length=512
+        )
 
 def summarize_text(text, max_length=130, min_length=30):
     """Summarize text."""
     model = load_summarization_model()
-    result = model(text, max_length=max_length, min_length=min_length, do_sample=False)[0]
+    with torch.inference_mode():
+        result = model(text, max_length=max_length, min_length=min_length, do_sample=False)[0]
     return result['summary_text']
 
+def summarize_text_batch(texts, max_length=130, min_length=30):
+    """Summarize a list of texts in batched generate calls."""
+    model = load_summarization_model()
+    with torch.inference_mode():
+        results = model(
+            list(texts),
+            max_length=max_length,
+            min_length=min_length,
+            do_sample=False,
+            batch_size=SUMMARY_BATCH_SIZE,
+            truncation=True
+        )
+    return [result['summary_text'] for result in results]
+
 def detect_fake_news(text):
     """Detect if news is fake."""
+    return detect_fake_news_batch([text])[0]
+
+def detect_fake_news_batch(texts):
+    """Detect fake news for a list of texts in batched forward passes."""
     model = load_fake_news_model()
-    result = model(text[:512])[0]
-    return result
+    with torch.inference_mode():
+        # The tokenizer truncates to 512 tokens, not characters
+        return model(
+            list(texts),
+            batch_size=Config.MAX_BATCH_SIZE,
+            truncation=True,
+            max_length=512
+        )
+
+@st.cache_resource(max_entries=512, show_spinner=False)
+def encode_text(text):
+    """Encode text for job matching, cached by content."""
+    model = load_job_matcher_model()
+    with torch.inference_mode():
+        return model.encode(text, convert_to_tensor=True).float().cpu()
 
 def match_job(resume, job_description):
     """Match resume to job description."""
-    model = load_job_matcher_model()
-    
-    # Encode texts
-    resume_embedding = model.encode(resume, convert_to_tensor=True)
-    job_embedding = model.encode(job_description, convert_to_tensor=True)
+    # Encode texts (an unchanged side is served from cache)
+    resume_embedding = encode_text(resume)
+    job_embedding = encode_text(job_description)
     
     # Calculate similarity
     similarity = util.pytorch_cos_sim(resume_embedding, job_embedding)[0][0].item()
@@ -340,28 +772,64 @@ def match_job(resume, job_description):
         'recommendation': get_match_recommendation(similarity)
     }
 
+def match_jobs(resume, jobs):
+    """Match one resume against many job descriptions in a single batched encode."""
+    model = load_job_matcher_model()
+    
+    # Normalized embeddings make the dot product equal to cosine similarity
+    with torch.inference_mode():
+        embeddings = model.encode(
+            [resume] + list(jobs),
+            convert_to_tensor=True,
+            normalize_embeddings=True,
+            batch_size=32
+        )
+    scores = (embeddings[1:] @ embeddings[0]).float().cpu().numpy()
+    
+    return pd.DataFrame({
+        'similarity_score': scores,
+        'match_percentage': scores * 100,
+        'recommendation': get_match_recommendation(scores)
+    })
+
 def get_match_recommendation(score):
-    """Get recommendation based on match score."""
-    if score >= 0.9:
-        return "Excellent Match"
-    elif score >= 0.8:
-        return "Strong Match"
-    elif score >= 0.7:
-        return "Good Match"
-    elif score >= 0.6:
-        return "Fair Match"
-    else:
-        return "Weak Match"
+    """Get recommendation based on match score (a float or an array of floats)."""
+    labels = MATCH_LABELS[np.searchsorted(MATCH_THRESHOLDS, score, side='right')]
+    return labels if np.ndim(score) else str(labels)
 
 
 # ==================================================
 # AUTHENTICATION PAGES
 # ==================================================
 
+def make_session_token(username, created_at):
+    """Sign username and account creation time with the app secret."""
+    message = f"{username}:{created_at}".encode('utf-8')
+    return hmac.new(Config.SECRET_KEY.encode('utf-8'), message, hashlib.sha256).hexdigest()
+
+def verify_session_token():
+    """Check the session token without re-running bcrypt."""
+    username = st.session_state.get('username')
+    token = st.session_state.get('auth_token')
+    if not username or not token:
+        return False
+    
+    user_data = get_user_manager().get_user(username)
+    if user_data is None:
+        return False
+    
+    expected = make_session_token(username, user_data.get('created_at'))
+    return hmac.compare_digest(token, expected)
+
 def login_page():
     """Login page."""
     st.title("🔐 Login to TextAI Studio")
     
+    # Already logged in: skip the bcrypt check entirely
+    if st.session_state.get('authenticated'):
+        st.info(f"Already logged in as {st.session_state.username}.")
+        return
+    
     with st.form("login_form"):
         username = st.text_input("Username")
         password = st.text_input("Password", type="password")
@@ -372,12 +840,13 @@ def login_page():
                 st.error("Please enter both username and password")
                 return
             
-            user_manager = UserManager()
+            user_manager = get_user_manager()
             if user_manager.authenticate_user(username, password):
                 st.session_state.authenticated = True
                 st.session_state.username = username
                 user_data = user_manager.get_user(username)
                 st.session_state.user_tier = user_data.get('tier', 'user')
+                st.session_state.auth_token = make_session_token(username, user_data.get('created_at'))
                 st.success("Login successful!")
                 st.rerun()
             else:
@@ -412,7 +881,7 @@ def signup_page():
                 return
             
             # Register user
-            user_manager = UserManager()
+            user_manager = get_user_manager()
             success, message = user_manager.register_user(username, password, email)
             
             if success:
@@ -428,6 +897,7 @@ def logout():
     st.session_state.authenticated = False
     st.session_state.username = None
     st.session_state.user_tier = None
+    st.session_state.auth_token = None
     st.rerun()
 
 
@@ -455,7 +925,7 @@ def sentiment_analysis_page():
                 
                 # Save to history
                 if st.session_state.get('authenticated'):
-                    history_manager = HistoryManager()
+                    history_manager = get_history_manager()
                     history_manager.add_entry(
                         st.session_state.username,
                         'sentiment_analysis',
@@ -475,20 +945,8 @@ def sentiment_analysis_page():
                     st.metric("Confidence", f"{result['score']:.2%}")
                 
                 # Visualization
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=result['score'] * 100,
-                    title={'text': "Confidence Score"},
-                    gauge={
-                        'axis': {'range': [0, 100]},
-                        'bar': {'color': "darkgreen" if result['label'] == 'POSITIVE' else "darkred"},
-                        'steps': [
-                            {'range': [0, 50], 'color': "lightgray"},
-                            {'range': [50, 100], 'color': "gray"}
-                        ]
-                    }
-                ))
-                st.plotly_chart(fig)
+                st.caption("Confidence Score")
+                st.progress(int(result['score'] * 100))
                 
             except Exception as e:
                 st.error(f"Error: {str(e)}")
@@ -521,7 +979,7 @@ def text_summarization_page():
                 
                 # Save to history
                 if st.session_state.get('authenticated'):
-                    history_manager = HistoryManager()
+                    history_manager = get_history_manager()
                     history_manager.add_entry(
                         st.session_state.username,
                         'text_summarization',
@@ -565,7 +1023,7 @@ def fake_news_detection_page():
                 
                 # Save to history
                 if st.session_state.get('authenticated'):
-                    history_manager = HistoryManager()
+                    history_manager = get_history_manager()
                     history_manager.add_entry(
                         st.session_state.username,
                         'fake_news_detection',
@@ -589,18 +1047,8 @@ def fake_news_detection_page():
                     st.metric("Confidence", f"{result['score']:.2%}")
                 
                 # Visualization
-                fig = go.Figure(go.Bar(
-                    x=[result['score']],
-                    y=[result['label']],
-                    orientation='h',
-                    marker_color='red' if 'FAKE' in result['label'].upper() else 'green'
-                ))
-                fig.update_layout(
-                    title="Confidence Score",
-                    xaxis_title="Score",
-                    showlegend=False
-                )
-                st.plotly_chart(fig)
+                st.caption("Confidence Score")
+                st.bar_chart(pd.Series({result['label']: result['score']}))
                 
             except Exception as e:
                 st.error(f"Error: {str(e)}")
@@ -631,7 +1079,7 @@ def job_matching_page():
                 
                 # Save to history
                 if st.session_state.get('authenticated'):
-                    history_manager = HistoryManager()
+                    history_manager = get_history_manager()
                     history_manager.add_entry(
                         st.session_state.username,
                         'job_matching',
@@ -656,27 +1104,9 @@ def job_matching_page():
                     st.markdown(f"**Recommendation:**")
                     st.markdown(f":{color}[{recommendation}]")
                 
-                # Gauge chart
-                fig = go.Figure(go.Indicator(
-                    mode="gauge+number",
-                    value=result['match_percentage'],
-                    title={'text': "Match Percentage"},
-                    gauge={
-                        'axis': {'range': [0, 100]},
-                        'bar': {'color': "darkblue"},
-                        'steps': [
-                            {'range': [0, 60], 'color': "lightcoral"},
-                            {'range': [60, 80], 'color': "lightyellow"},
-                            {'range': [80, 100], 'color': "lightgreen"}
-                        ],
-                        'threshold': {
-                            'line': {'color': "red", 'width': 4},
-                            'thickness': 0.75,
-                            'value': 90
-                        }
-                    }
-                ))
-                st.plotly_chart(fig)
+                # Visualization
+                st.caption("Match Percentage")
+                st.progress(min(max(int(result['match_percentage']), 0), 100))
                 
             except Exception as e:
                 st.error(f"Error: {str(e)}")
@@ -686,6 +1116,21 @@ def job_matching_page():
 # BATCH PROCESSING
 # ==================================================
 
+def read_csv(uploaded_file):
+    """Read an uploaded CSV, using pyarrow's multithreaded parser when available."""
+    if pa is None:
+        return pd.read_csv(uploaded_file)
+    return pd.read_csv(uploaded_file, engine='pyarrow')
+
+def to_csv_bytes(df):
+    """Serialize a DataFrame to CSV bytes, using pyarrow's C++ writer when available."""
+    if pa is None:
+        return df.to_csv(index=False).encode('utf-8')
+    
+    buffer = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+    return buffer.getvalue().to_pybytes()
+
 def batch_processing_page():
     """Batch processing page."""
     st.title("📁 Batch Processing")
@@ -694,15 +1139,20 @@ def batch_processing_page():
     # Select tool
     tool = st.selectbox(
         "Select Tool:",
-        ["Sentiment Analysis", "Text Summarization", "Fake News Detection"]
+        ["Sentiment Analysis", "Text Summarization", "Fake News Detection", "Job Matching"]
     )
     
+    # Job matching compares every row against one resume
+    if tool == "Job Matching":
+        resume = st.text_area("Enter resume:", height=150,
+                              placeholder="Skills, experience, education...")
+    
     # Upload CSV
     uploaded_file = st.file_uploader("Upload CSV file", type=['csv'])
     
     if uploaded_file:
         try:
-            df = pd.read_csv(uploaded_file)
+            df = read_csv(uploaded_file)
             st.write("Preview:", df.head())
             
             # Select text column
@@ -710,55 +1160,83 @@ def batch_processing_page():
             
             process_btn = st.button("Process Batch", type="primary")
             
-            if process_btn:
-                with st.spinner(f"Processing {len(df)} items..."):
-                    results = []
-                    progress_bar = st.progress(0)
+            if process_btn and tool == "Job Matching" and not resume:
+                st.warning("Please enter a resume to match against.")
+            
+            elif process_btn:
+                # One collapsed status box, updated once per percent of progress
+                with st.status(f"Processing {len(df)} items...", expanded=False) as status:
+                    # Blank cells become '' so every row is a str (pandas 3 keeps NaN under astype(str))
+                    texts = df[text_column].fillna('').astype(str).tolist()
+                    
+                    # Duplicate rows share one model call, and sorting by length keeps
+                    # similar lengths in the same batch so little compute goes to padding.
+                    # inverse maps each row back to its unique text.
+                    unique_texts = sorted(set(texts), key=len)
+                    positions = {text: i for i, text in enumerate(unique_texts)}
+                    inverse = np.fromiter((positions[text] for text in texts), dtype=np.intp, count=len(texts))
+                    n = len(unique_texts)
+                    
+                    # Results are built column by column, never row by row
+                    columns = {'text': [text[:100] for text in texts]}
+                    last_percent = 0
                     
-                    for idx, row in df.iterrows():
-                        text = str(row[text_column])
+                    if tool == "Job Matching":
+                        matches = match_jobs(resume, unique_texts)
+                        columns.update(matches.iloc[inverse].reset_index(drop=True).items())
+                    
+                    elif tool == "Text Summarization":
+                        summaries = np.empty(n, dtype=object)
+                        for start in range(0, n, SUMMARY_BATCH_SIZE):
+                            chunk = unique_texts[start:start + SUMMARY_BATCH_SIZE]
+                            summaries[start:start + len(chunk)] = summarize_text_batch(chunk)
+                            
+                            # Update progress (at most once per percent)
+                            percent = (start + len(chunk)) * 100 // n
+                            if percent > last_percent:
+                                status.update(label=f"Processing {len(df)} items... {percent}%")
+                                last_percent = percent
                         
-                        # Process based on tool
+                        columns['summary'] = summaries[inverse]
+                    
+                    else:
+                        # Classifiers run one forward pass per chunk of rows
                         if tool == "Sentiment Analysis":
-                            result = analyze_sentiment(text)
-                            results.append({
-                                'text': text[:100],
-                                'label': result['label'],
-                                'score': result['score']
-                            })
-                        
-                        elif tool == "Text Summarization":
-                            summary = summarize_text(text)
-                            results.append({
-                                'text': text[:100],
-                                'summary': summary
-                            })
+                            classify = analyze_sentiment_batch
+                        else:
+                            classify = detect_fake_news_batch
                         
-                        elif tool == "Fake News Detection":
-                            result = detect_fake_news(text)
-                            results.append({
-                                'text': text[:100],
-                                'label': result['label'],
-                                'score': result['score']
-                            })
+                        labels = np.empty(n, dtype=object)
+                        scores = np.empty(n, dtype=np.float32)
+                        for start in range(0, n, Config.MAX_BATCH_SIZE):
+                            chunk = unique_texts[start:start + Config.MAX_BATCH_SIZE]
+                            for i, output in enumerate(classify(chunk), start):
+                                labels[i] = output['label']
+                                scores[i] = output['score']
+                            
+                            # Update progress (at most once per percent)
+                            percent = (start + len(chunk)) * 100 // n
+                            if percent > last_percent:
+                                status.update(label=f"Processing {len(df)} items... {percent}%")
+                                last_percent = percent
                         
-                        # Update progress
-                        progress_bar.progress((idx + 1) / len(df))
+                        columns['label'] = labels[inverse]
+                        columns['score'] = scores[inverse]
                     
                     # Create results dataframe
-                    results_df = pd.DataFrame(results)
-                    
-                    st.success(f"Processed {len(results)} items!")
-                    st.dataframe(results_df)
-                    
-                    # Download button
-                    csv = results_df.to_csv(index=False)
-                    st.download_button(
-                        label="Download Results",
-                        data=csv,
-                        file_name=f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                        mime="text/csv"
-                    )
+                    results_df = pd.DataFrame(columns)
+                    status.update(label=f"Processed {len(results_df)} items!", state="complete")
+                
+                st.dataframe(results_df)
+                
+                # Download button
+                csv = to_csv_bytes(results_df)
+                st.download_button(
+                    label="Download Results",
+                    data=csv,
+                    file_name=f"batch_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
+                    mime="text/csv"
+                )
         
         except Exception as e:
             st.error(f"Error processing file: {str(e)}")
@@ -768,6 +1246,24 @@ def batch_processing_page():
 # ANALYTICS & DASHBOARDS
 # ==================================================
 
+@st.cache_data(max_entries=1000, show_spinner=False)
+def build_tools_chart(tools_items):
+    """Bar chart of queries per tool from (tool, count) pairs."""
+    # Imported here so pages without charts never pay plotly's import time
+    import plotly.express as px
+    
+    tools_df = pd.DataFrame(list(tools_items), columns=['Tool', 'Count'])
+    return px.bar(tools_df, x='Tool', y='Count', title="Queries by Tool")
+
+@st.cache_data(max_entries=1000, show_spinner=False)
+def build_usage_chart(date_items):
+    """Line chart of daily query volume from (date, count) pairs."""
+    import plotly.express as px
+    
+    dates_df = pd.DataFrame(list(date_items), columns=['Date', 'Count'])
+    dates_df['Date'] = pd.to_datetime(dates_df['Date'])
+    return px.line(dates_df, x='Date', y='Count', title="Daily Query Volume")
+
 def analytics_dashboard():
     """User analytics dashboard."""
     st.title("📊 Analytics Dashboard")
@@ -777,10 +1273,11 @@ def analytics_dashboard():
         return
     
     username = st.session_state.username
-    history_manager = HistoryManager()
+    history_manager = get_history_manager()
     
     # Get analytics
-    analytics = history_manager.get_analytics(username)
+    last_ts = history_manager.last_entry_ts(username)
+    analytics = cached_analytics(username, last_ts, datetime.now().date())
     
     if not analytics:
         st.info("No usage data yet. Start using the tools!")
@@ -806,27 +1303,20 @@ def analytics_dashboard():
     
     # Tools usage chart
     st.subheader("Tools Usage")
-    tools_df = pd.DataFrame(list(analytics['tools_used'].items()), 
-                           columns=['Tool', 'Count'])
-    fig = px.bar(tools_df, x='Tool', y='Count', title="Queries by Tool")
+    fig = build_tools_chart(tuple(analytics['tools_used'].items()))
     st.plotly_chart(fig, use_container_width=True)
     
     # Usage over time
     st.subheader("Usage Over Time")
     if analytics['queries_by_date']:
-        dates_df = pd.DataFrame(list(analytics['queries_by_date'].items()), 
-                               columns=['Date', 'Count'])
-        dates_df['Date'] = pd.to_datetime(dates_df['Date'])
-        fig = px.line(dates_df, x='Date', y='Count', title="Daily Query Volume")
+        fig = build_usage_chart(tuple(analytics['queries_by_date'].items()))
         st.plotly_chart(fig, use_container_width=True)
     
     # Recent history
     st.subheader("Recent Activity")
-    history = history_manager.get_history(username, limit=10)
-    if history:
-        history_df = pd.DataFrame(history)
-        history_df['timestamp'] = pd.to_datetime(history_df['timestamp'])
-        st.dataframe(history_df[['timestamp', 'tool', 'query']], use_container_width=True)
+    history_df = recent_activity_df(username, last_ts)
+    if history_df is not None:
+        st.dataframe(history_df, use_container_width=True)
 
 def admin_dashboard():
     """Admin monitoring dashboard."""
@@ -844,7 +1334,7 @@ def admin_dashboard():
     # System stats
     st.subheader("System Statistics")
     
-    user_manager = UserManager()
+    user_manager = get_user_manager()
     total_users = len(user_manager.users)
     
     col1, col2, col3 = st.columns(3)
@@ -854,11 +1344,7 @@ def admin_dashboard():
     
     with col2:
         # Count total queries across all users
-        history_manager = HistoryManager()
-        total_queries = 0
-        for user_file in HISTORY_DIR.glob("*.json"):
-            with open(user_file) as f:
-                total_queries += len(json.load(f))
+        total_queries = total_query_count()
         st.metric("Total Queries", total_queries)
     
     with col3:
@@ -868,17 +1354,16 @@ def admin_dashboard():
     
     # User list
     st.subheader("User Management")
-    users_data = []
-    for username, data in user_manager.users.items():
-        users_data.append({
-            'Username': username,
-            'Email': data.get('email', 'N/A'),
-            'Tier': data.get('tier', 'user'),
-            'Created': data.get('created_at', 'N/A')[:10]
-        })
-    
-    if users_data:
-        users_df = pd.DataFrame(users_data)
+    users = user_manager.users
+    usernames = list(users)
+    
+    if usernames:
+        users_df = pd.DataFrame({
+            'Username': usernames,
+            'Email': [users[u].get('email') or 'N/A' for u in usernames],
+            'Tier': [users[u].get('tier') or 'user' for u in usernames],
+            'Created': [(users[u].get('created_at') or 'N/A')[:10] for u in usernames]
+        }, dtype='string')
         st.dataframe(users_df, use_container_width=True)
 
 def settings_page():
@@ -895,7 +1380,7 @@ def settings_page():
     st.write("Generate an API key to access TextAI Studio programmatically.")
     
     if st.button("Generate API Key"):
-        api_manager = APIKeyManager()
+        api_manager = get_api_key_manager()
         api_key = api_manager.generate_key(username)
         
         st.success("API Key Generated!")
@@ -921,13 +1406,13 @@ print(response.json())
     st.markdown("---")
     
     st.subheader("Account Information")
-    user_manager = UserManager()
+    user_manager = get_user_manager()
     user_data = user_manager.get_user(username)
     
     st.write(f"**Username:** {username}")
-    st.write(f"**Email:** {user_data.get('email', 'N/A')}")
+    st.write(f"**Email:** {user_data.get('email') or 'N/A'}")
     st.write(f"**Tier:** {user_data.get('tier', 'user')}")
-    st.write(f"**Created:** {user_data.get('created_at', 'N/A')[:10]}")
+    st.write(f"**Created:** {(user_data.get('created_at') or 'N/A')[:10]}")
 
 
 # ==================================================
@@ -945,6 +1430,10 @@ def main():
     if 'user_tier' not in st.session_state:
         st.session_state.user_tier = 'guest'
     
+    # Reruns verify the signed session token (microseconds) instead of bcrypt
+    if st.session_state.authenticated and not verify_session_token():
+        logout()
+    
     # Sidebar
     with st.sidebar:
         st.title("🤖 TextAI Studio")
@@ -964,29 +1453,14 @@ def main():
         
         # Navigation
         if st.session_state.authenticated:
-            page = st.radio(
-                "Navigate:",
-                [
-                    "🏠 Home",
-                    "😊 Sentiment Analysis",
-                    "📄 Text Summarization",
-                    "🔍 Fake News Detection",
-                    "💼 Job Matching",
-                    "📁 Batch Processing",
-                    "📊 Analytics",
-                    "⚙️ Settings"
-                ]
-            )
+            page = st.radio("Navigate:", AUTH_NAV_OPTIONS)
             
             # Admin option
             if st.session_state.username == 'admin':
                 if st.button("👑 Admin Dashboard", use_container_width=True):
                     st.session_state.page = "admin"
         else:
-            page = st.radio(
-                "Navigate:",
-                ["🏠 Home", "🔐 Login", "📝 Signup"]
-            )
+            page = st.radio("Navigate:", ANON_NAV_OPTIONS)
         
         st.markdown("---")
         st.caption("v1.0.0 | Built with ❤️")
@@ -1052,8 +1526,9 @@ def main():
             st.markdown("---")
             st.subheader("📈 Quick Stats")
             
-            history_manager = HistoryManager()
-            analytics = history_manager.get_analytics(st.session_state.username)
+            history_manager = get_history_manager()
+            last_ts = history_manager.last_entry_ts(st.session_state.username)
+            analytics = cached_analytics(st.session_state.username, last_ts, datetime.now().date())
             
             if analytics:
                 col1, col2, col3 = st.columns(3)